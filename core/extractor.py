@@ -1,8 +1,15 @@
-import pdfplumber
+import os
 import re
+import sys
 import json
+import logging
+import functools
+import threading
 from collections import Counter
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
 
 # ----------------------------------------------------------
 #  Senior-Engineer-Level PDF Resume Extractor
@@ -17,11 +24,13 @@ VALID_URL_ENDINGS = [
     ".gov", ".us", ".uk", ".de", ".fr", ".jp", ".ca", ".au", ".info",
     ".dev", ".tech", ".biz", ".online", ".me", ".ly", ".app", ".cloud"
 ]
+# Suffix lookups go through a set, so their cost does not grow with the list
+VALID_URL_ENDINGS_SET = frozenset(VALID_URL_ENDINGS)
 
-EMAIL_DOMAINS = [
+EMAIL_DOMAINS = frozenset({
     "gmail.com", "yahoo.com", "outlook.com", "hotmail.com",
     "icloud.com", "protonmail.com", "aol.com", "mail.com"
-]
+})
 
 COMMON_SECTION_HEADINGS = {
     # Work Experience
@@ -68,57 +77,120 @@ COMMON_SECTION_HEADINGS = {
     "SUMMARY OF AWARDS", "SUMMARY OF HOBBIES", "SUMMARY OF ACCOMPLISHMENTS",
     "SUMMARY OF ACHIEVEMENTS",
 }
-COMMON_SECTION_HEADINGS_LOWER = {h.lower() for h in COMMON_SECTION_HEADINGS}
+COMMON_SECTION_HEADINGS_LOWER = frozenset(sys.intern(h.lower()) for h in COMMON_SECTION_HEADINGS)
+MAX_SECTION_HEADING_LEN = max(len(h) for h in COMMON_SECTION_HEADINGS_LOWER)
 
+DIGITS = frozenset("0123456789")
+
+# Only used as a yes/no test in is_job_title. "Jan 2020", "2019 - 2021",
+# "2019-Present" and "Summer 2020" all contain a standalone 4-digit year,
+# so the year-only branch already covers them.
 DATE_PATTERN = re.compile(
-    r"(?:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b)|"  # Month Year
-    r"\b\d{4}\b|"                                                                  # Year only
-    r"(?:\b(?:19|20)\d{2}\s*[–\-—]\s*(?:19|20)\d{2}\b)|"                           # Year range
-    r"\b(?:19|20)\d{2}\s*-\s*Present\b|"                                           # Year-Present
-    r"\b(?:Present|Current)\b|"                                                    # Present/Current
-    r"\b(?:Summer|Winter|Fall|Spring)\s*(?:19|20)\d{2}\b"                          # Season Year
+    r"\b\d{4}\b|"                                        # Any year (Month Year, ranges, ...)
+    r"\b(?:Present|Current)\b|"                          # Present/Current
+    r"\b(?:Summer|Winter|Fall|Spring)(?:19|20)\d{2}\b"    # Season glued to year, e.g. "Fall2021"
 )
 
-BULLET_PATTERNS = [
-    r'^\s*[•▪♦➢➔⦿◦‣⁃■○✓]\s*',  # Various bullet chars
-    r'^\s*[\*\-\+]\s+',         # Asterisk, hyphen, plus
-    r'^\s*\d+[\.\)]\s*',        # Numbered list (1., 2) or 1)
-    r'^\s*[a-z]\)\s*',          # Letter lists (a), b)
+JOB_TITLE_PATTERNS = [
+    r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:at|@)\s+',   # "Position at Company"
+    r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s+',             # "Position, Company"
+    r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+[–\-—]\s+',     # "Position - Company"
+    r'^[A-Z][a-zA-Z0-9\s&]+\s*[•\-|]\s*',               # "Company • Position"
+    r'^(?:Senior|Junior|Lead|Principal)\s+[A-Z][a-z]+', # "Senior Developer"
+    r'^[A-Z][a-z]+\s+(?:Engineer|Developer|Manager|Specialist|Analyst|Designer)\b',
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+(?:Team|Group|Department)\b'
 ]
-BULLET_DETECT_PATTERN = re.compile('|'.join(BULLET_PATTERNS))
-REMOVE_BULLET_PATTERN = re.compile('|'.join(BULLET_PATTERNS))
+# All alternatives are anchored at ^, so one search over the alternation
+# answers the same question as searching each pattern in turn.
+JOB_TITLE_PATTERN = re.compile('|'.join(JOB_TITLE_PATTERNS))
+
+HYPHENATED_WORD_PATTERN = re.compile(r'(\w+)-\s+(\w+)')
+WORD_TOKEN_PATTERN = re.compile(r'[a-z]+')
 
-# For deciding whether we should merge lines
-INCOMPLETE_REGEX = re.compile(
-    r'[^.!?]$|[,;:]$|(?:\b(?:and|or|but|with|for|to|the|a|an|in|on|at|by|using)\s*$)',
+EMAIL_PATTERN = re.compile(
+    r'(?:\b|mailto:)[a-zA-Z0-9._%+-]+@'
+    r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b',
     re.IGNORECASE
 )
 
-# For final bullet merges in post-processing
-INCOMPLETE_SENTENCE_PATTERN = re.compile(
+# URLs are scanned with the email branch first, so an address is consumed
+# whole instead of leaking its domain as a link. Emails themselves come
+# from EMAIL_PATTERN: a URL path can swallow an address that follows it
+# in the same token (www.x.com/in/a@gmail.com).
+CONTACT_PATTERN = re.compile(
     r'''
-    (?:[^.!?]\s*$)|                  # Ends without punctuation
-    (?:[a-z][^.!?]\s*$)|             # Ends with lowercase letter
-    (?:[,;:]\s*$)|                   # Ends with comma/semicolon/colon
-    (?:\b(?:and|or|but|with|for|to|the|a|an|in|on|at|by|as|using|via|through|while|when|where|who|which)\s*$)|
-    (?:\b(?:including|such as|e\.g\.|i\.e\.|etc\.?)\s*$)|
-    (?:\b(?:developed|created|built|implemented|designed|managed|led)\s*$)|
-    (?:\b[a-z]+ing\s*$)|
-    (?:\b[a-z]+ed\s*$)
+    (?P<email>
+        (?:\b|mailto:)[a-zA-Z0-9._%+-]+@
+        [a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b
+    )
+    |
+    (?P<url>
+        \b(?:https?://|www\.)
+        [a-zA-Z0-9-]+
+        (?:\.[a-zA-Z0-9-]+)+
+        (?:/[^\s]*)?
+        |
+        \b[a-zA-Z0-9-]+\.
+        (?:com|org|net|io|co|ai|edu|gov|us|uk|de|fr|jp|ca|au|info|dev|tech|biz)\b
+    )
     ''',
     re.IGNORECASE | re.VERBOSE
 )
 
+# Bullet markers are checked with plain character tests instead of a regex:
+#   - symbol bullets:   "•", "▪", "✓", ...  (optionally followed by spaces)
+#   - ASCII bullets:    "*", "-", "+"       (must be followed by whitespace)
+#   - numbered lists:   "1.", "2)"
+#   - letter lists:     "a)", "b)"
+SYMBOL_BULLETS = frozenset("•▪♦➢➔⦿◦‣⁃■○✓")
+ASCII_BULLETS = frozenset("*-+")
+
+# For final bullet merges in post-processing: abbreviations that end in
+# a period but still mean the sentence continues
+CONTINUING_ABBREVIATIONS = ("e.g.", "i.e.", "etc.")
+
 # ----------------------------------------------------------
 # 2) Bullet / Line / Noise Detection
 # ----------------------------------------------------------
 
+def bullet_marker_end(line: str) -> int:
+    """
+    Returns the index just past a leading bullet marker and the
+    whitespace after it, or 0 if the line does not start with one.
+    """
+    body = line.lstrip()
+    if not body:
+        return 0
+    first = body[0]
+
+    if first in SYMBOL_BULLETS:
+        marker_len = 1
+    elif first in ASCII_BULLETS:
+        if len(body) < 2 or not body[1].isspace():
+            return 0
+        marker_len = 1
+    elif first.isdecimal():
+        marker_len = 1
+        while marker_len < len(body) and body[marker_len].isdecimal():
+            marker_len += 1
+        if body[marker_len:marker_len + 1] not in (".", ")"):
+            return 0
+        marker_len += 1
+    elif "a" <= first <= "z" and body[1:2] == ")":
+        marker_len = 2
+    else:
+        return 0
+
+    rest = body[marker_len:]
+    return len(line) - len(rest.lstrip())
+
+
 def is_bullet_line(line: str) -> bool:
     """
     Returns True only if the line starts with a recognized
     bullet character, number, or letter pattern.
     """
-    return bool(BULLET_DETECT_PATTERN.match(line))
+    return bullet_marker_end(line) > 0
 
 
 def should_merge_lines(prev_line: str, current_line: str) -> bool:
@@ -131,13 +203,11 @@ def should_merge_lines(prev_line: str, current_line: str) -> bool:
         return False
     prev_line_stripped = prev_line.strip()
 
-    # If the previous line ends with . ! or ?, it's probably done
-    if re.search(r'[.!?]$', prev_line_stripped):
-        return False
-
-    # If the previous line is incomplete (no punctuation, ends with connector)
-    if INCOMPLETE_REGEX.search(prev_line_stripped):
-        return True
+    # If the previous line ends with . ! or ?, it's probably done;
+    # anything else (no punctuation, a trailing comma or connector
+    # word) leaves it incomplete
+    if prev_line_stripped:
+        return not prev_line_stripped.endswith(('.', '!', '?'))
 
     # If the current line starts with lowercase, it might be continuing
     if current_line and current_line[0].islower():
@@ -146,6 +216,29 @@ def should_merge_lines(prev_line: str, current_line: str) -> bool:
     return False
 
 
+def is_incomplete_sentence(text: str) -> bool:
+    """
+    True if the text looks unfinished: it does not end with . ! or ?,
+    or it ends with an abbreviation like "e.g." that introduces more.
+    Trailing connectors ("and", "using"), commas and -ing/-ed words all
+    fall under the first rule, so only the last character and a short
+    tail need checking.
+    """
+    if not text:
+        return False
+    if text[-1] not in ".!?":
+        return True
+
+    tail = text[-4:].lower()
+    for abbreviation in CONTINUING_ABBREVIATIONS:
+        if tail.endswith(abbreviation):
+            # Must start a word, like the regex \b did ("the.g." does not count)
+            start = len(text) - len(abbreviation)
+            if start == 0 or not (text[start - 1].isalnum() or text[start - 1] == "_"):
+                return True
+    return False
+
+
 def filter_noise(bullets: List[str]) -> List[str]:
     """
     Optional: Remove lines that look too short or have no
@@ -173,54 +266,188 @@ def filter_noise(bullets: List[str]) -> List[str]:
 # 3) Text Extraction & Basic Parsing
 # ----------------------------------------------------------
 
+# PDFium is not thread-safe; the API runs extraction in a threadpool, so
+# every call into it is serialized on this lock.
+_PDFIUM_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pypdfium2():
+    """
+    Returns the pypdfium2 module, or None if it is not installed.
+    Imported lazily and only once, like pdfplumber below.
+    """
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    return pypdfium2
+
+
+def _iter_raw_page_texts(pdf_path: str) -> Iterator[str]:
+    """
+    Yields each page's raw text. Prefers pypdfium2 (PDFium, several times
+    faster than pdfminer) and falls back to pdfplumber when it is missing.
+    """
+    pdfium = _load_pypdfium2()
+    if pdfium is None:
+        # Imported lazily: pdfplumber/pdfminer are slow to import and are
+        # only needed once a PDF is actually read.
+        import pdfplumber
+
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                yield page.extract_text() or ""
+        return
+
+    # The lock is taken per PDFium call rather than across the yields, so
+    # a caller that stops iterating early never leaves it held.
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(pdf_path)
+        page_count = len(pdf)
+    try:
+        for index in range(page_count):
+            with _PDFIUM_LOCK:
+                page = pdf[index]
+                textpage = page.get_textpage()
+                try:
+                    page_text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+            # PDFium separates lines with "\r\n"; normalize to pdfplumber's "\n"
+            yield page_text.replace("\r\n", "\n")
+    finally:
+        with _PDFIUM_LOCK:
+            pdf.close()
+
+
+def iter_pdf_pages(pdf_path: str) -> Iterator[str]:
+    """
+    Yields the text of each PDF page in order, one page at a time.
+    Handles hyphenated words (like "execute-\nion").
+    """
+    for page_text in _iter_raw_page_texts(pdf_path):
+        # Merge hyphenated words across line breaks; most pages have no
+        # hyphen at all, so skip the regex when there is nothing to merge
+        if '-' in page_text:
+            page_text = HYPHENATED_WORD_PATTERN.sub(r'\1\2', page_text)
+        yield page_text
+
+
+def iter_pdf_lines(pdf_path: str) -> Iterator[str]:
+    """
+    Yields the PDF's text line by line, page by page, so callers like
+    `extract_sections` never need the whole document in one string.
+    """
+    for page_text in iter_pdf_pages(pdf_path):
+        yield from page_text.splitlines()
+
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Extracts text from a PDF while preserving line breaks.
     Handles hyphenated words (like "execute-\nion").
+    Results are cached per path and invalidated when the file changes.
     """
-    full_text = []
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                # Merge hyphenated words across line breaks
-                page_text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', page_text)
-                full_text.append(page_text)
+        stat = os.stat(pdf_path)
+        return _extract_text_cached(pdf_path, stat.st_mtime_ns, stat.st_size)
     except Exception as e:
-        print(f"Error reading PDF: {e}")
+        # Raised inside the cached call, so failed reads are never cached
+        logger.warning("Error reading PDF %s: %s", pdf_path, e)
         return ""
 
-    return "\n".join(full_text).strip()
+
+@functools.lru_cache(maxsize=128)
+def _extract_text_cached(pdf_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Cached `_read_pdf_text`; mtime_ns and size are only part of the cache key.
+    """
+    return _read_pdf_text(pdf_path)
+
+
+def _read_pdf_text(pdf_path: str) -> str:
+    """
+    The whole PDF's text, uncached. Raises if the PDF cannot be read.
+    """
+    return "\n".join(iter_pdf_pages(pdf_path)).strip()
+
+
+def extract_texts_from_pdfs(
+    pdf_paths: List[str],
+    max_workers: Optional[int] = None,
+    chunksize: int = 4,
+) -> List[str]:
+    """
+    Extracts text from many PDFs in parallel, one worker process per file.
+    Paths are sent to workers `chunksize` at a time to cut IPC round trips.
+    Results are returned in the same order as `pdf_paths`.
+    """
+    if len(pdf_paths) <= 1:
+        return [extract_text_from_pdf(path) for path in pdf_paths]
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(pdf_paths))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(extract_text_from_pdf, pdf_paths, chunksize=chunksize))
+
+
+def has_valid_url_ending(url: str) -> bool:
+    """
+    True if the URL ends with one of VALID_URL_ENDINGS, or has one right
+    before a "/" (e.g. "github.com/user"). Every ending starts with a dot,
+    so only the dot-suffixes of each path segment need a set lookup.
+    """
+    for segment in url.split('/'):
+        dot = segment.rfind('.')
+        while dot != -1:
+            if segment[dot:] in VALID_URL_ENDINGS_SET:
+                return True
+            dot = segment.rfind('.', 0, dot)
+    return False
+
+
+def url_host(url: str) -> str:
+    """
+    Returns the lowercased host of a URL without scheme, "www."
+    prefix or path, e.g. "https://www.GitHub.com/x" -> "github.com".
+    """
+    host = url.lower()
+    for prefix in ("https://", "http://", "www."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    return host.split('/', 1)[0]
 
 
 def extract_contacts(text: str) -> Dict[str, List[str]]:
     """
     Extract emails and URLs. Then filter out junk (e.g. URL that is actually an email domain).
     """
-    email_pattern = (
-        r'(?:\b|mailto:)[a-zA-Z0-9._%+-]+@'
-        r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
-    )
-    url_pattern = r'''
-        \b(?:https?://|www\.)
-        [a-zA-Z0-9-]+
-        (?:\.[a-zA-Z0-9-]+)+
-        (?:/[^\s]*)?
-        |
-        \b[a-zA-Z0-9-]+\.
-        (?:com|org|net|io|co|ai|edu|gov|us|uk|de|fr|jp|ca|au|info|dev|tech|biz)\b
-    '''
-
-    emails_found = re.findall(email_pattern, text, re.IGNORECASE)
-    urls_found = re.findall(url_pattern, text, re.IGNORECASE | re.VERBOSE)
+    emails_found = []
+    urls_found = []
+    for line in text.splitlines():
+        # Every email and URL contains a ".", and every email an "@", so
+        # these cheap substring checks skip the regexes on most resume lines.
+        if '.' not in line:
+            continue
+        if '@' in line:
+            emails_found.extend(EMAIL_PATTERN.findall(line))
+        for match in CONTACT_PATTERN.finditer(line):
+            if match.lastgroup == "url":
+                urls_found.append(match.group())
 
     filtered_urls = []
+    seen_urls = set()
     for url in urls_found:
         url = url.strip().rstrip('/')
-        if any(url.endswith(tld) or f".{tld}/" in url for tld in VALID_URL_ENDINGS):
-            if not any(domain in url for domain in EMAIL_DOMAINS):
-                if url not in filtered_urls:
-                    filtered_urls.append(url)
+        # An address glued to a URL path (www.x.com/in/a@gmail.com) is
+        # reported as an email, not as a link
+        if '@' in url or url in seen_urls:
+            continue
+        seen_urls.add(url)
+        if has_valid_url_ending(url):
+            if url_host(url) not in EMAIL_DOMAINS:
+                filtered_urls.append(url)
 
     return {
         "emails": list({email.lower() for email in emails_found}),
@@ -237,31 +464,37 @@ def is_section_heading(line: str) -> bool:
     Check if a line is likely a resume section heading
     by comparing to known headings, case patterns, etc.
     """
-    line_stripped = line.strip()
-    line_lower = line_stripped.lower()
+    return _is_section_heading(line.strip())
 
-    # Check known headings
-    if line_lower in COMMON_SECTION_HEADINGS_LOWER:
-        return True
 
-    # All uppercase heading
+def _is_section_heading(line_stripped: str) -> bool:
+    """
+    `is_section_heading` for a line the caller has already stripped.
+    """
+    # Check known headings (lines longer than any heading skip the lower())
     if (
-        line_stripped == line_stripped.upper()
-        and len(line_stripped) > 3
-        and any(c.isalpha() for c in line_stripped)
+        len(line_stripped) <= MAX_SECTION_HEADING_LEN
+        and line_stripped.lower() in COMMON_SECTION_HEADINGS_LOWER
     ):
         return True
 
-    # Pattern: short line ending with colon, e.g. "WORK EXPERIENCE:"
-    if (
-        len(line_stripped.split()) <= 4
-        and (
-            line_stripped.endswith(':')
-            or re.search(r'^[A-Z][a-z]*(?:\s+[A-Z][a-z]*)*:$', line_stripped)
+    # All uppercase heading: no lowercase characters and at least one
+    # letter. Letters from uncased scripts (CJK, Arabic, ...) count, which
+    # isupper() alone would reject; checked in place, without building an
+    # uppercased copy.
+    if len(line_stripped) > 3 and (
+        line_stripped.isupper()
+        or (
+            not any(c.islower() for c in line_stripped)
+            and any(c.isalpha() for c in line_stripped)
         )
     ):
         return True
 
+    # Pattern: short line ending with colon, e.g. "WORK EXPERIENCE:"
+    if line_stripped.endswith(':') and len(line_stripped.split()) <= 4:
+        return True
+
     return False
 
 
@@ -271,32 +504,38 @@ def is_job_title(line: str) -> bool:
     - If the line contains date patterns
     - Or matches common job title patterns
     """
-    line = line.strip()
-    # If date found, we often treat it as a job or position block
-    if DATE_PATTERN.search(line):
+    return _is_job_title(line.strip())
+
+
+def _is_job_title(line: str) -> bool:
+    """
+    `is_job_title` for a line the caller has already stripped.
+    """
+    # If date found, we often treat it as a job or position block.
+    # Every date needs a digit or the word Present/Current, so skip the
+    # regex on the (much more common) lines that have neither.
+    if (
+        not DIGITS.isdisjoint(line) or "Present" in line or "Current" in line
+    ) and DATE_PATTERN.search(line):
         return True
 
-    patterns = [
-        r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:at|@)\s+',   # "Position at Company"
-        r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s+',             # "Position, Company"
-        r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+[–\-—]\s+',     # "Position - Company"
-        r'^[A-Z][a-zA-Z0-9\s&]+\s*[•\-|]\s*',               # "Company • Position"
-        r'^(?:Senior|Junior|Lead|Principal)\s+[A-Z][a-z]+', # "Senior Developer"
-        r'^[A-Z][a-z]+\s+(?:Engineer|Developer|Manager|Specialist|Analyst|Designer)\b',
-        r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+(?:Team|Group|Department)\b'
-    ]
-    return any(re.search(pattern, line) for pattern in patterns)
+    return bool(JOB_TITLE_PATTERN.search(line))
 
 
-def extract_sections(text: str) -> List[Dict]:
+def extract_sections(text: Union[str, Iterable[str]]) -> List[Dict]:
     """
     Split the resume text by lines, detect section headings,
     job titles, and group lines into structured sections.
+    `text` may also be an iterable of lines (e.g. `iter_pdf_lines`),
+    which is consumed lazily.
     """
-    lines = text.split("\n")
+    lines = text.splitlines() if isinstance(text, str) else text
     sections = []
     current_section = None
     current_entry = None
+    # Alias of current_entry["bullets"], so the common case (a bullet
+    # line) is a bare list append with no dict lookup
+    current_bullets = None
     previous_line_was_heading = False
 
     for raw_line in lines:
@@ -306,15 +545,16 @@ def extract_sections(text: str) -> List[Dict]:
             continue
 
         # If it's a recognized heading, start a new section
-        if is_section_heading(line):
+        if _is_section_heading(line):
             if current_section:  # close out old section
                 if current_entry:
                     current_section["entries"].append(current_entry)
                     current_entry = None
                 sections.append(current_section)
 
+            # Headings repeat across resumes; share one string per name
             current_section = {
-                "section_name": line,
+                "section_name": sys.intern(line),
                 "entries": []
             }
             previous_line_was_heading = True
@@ -325,25 +565,27 @@ def extract_sections(text: str) -> List[Dict]:
             continue
 
         # If it's a job title or we just had a heading, start a new "entry"
-        if is_job_title(line) or previous_line_was_heading:
+        if previous_line_was_heading or _is_job_title(line):
             if current_entry:
                 current_section["entries"].append(current_entry)
 
+            current_bullets = []
             current_entry = {
                 "title": line,
-                "bullets": []
+                "bullets": current_bullets
             }
             previous_line_was_heading = False
             continue
 
         # Otherwise, add line to current entry's bullets
         if current_entry:
-            current_entry["bullets"].append(line)
+            current_bullets.append(line)
         else:
             # Orphaned line (no job title yet) => create an "Additional" entry
+            current_bullets = [line]
             current_entry = {
                 "title": "Additional Information",
-                "bullets": [line]
+                "bullets": current_bullets
             }
 
         previous_line_was_heading = False
@@ -368,35 +610,36 @@ def merge_multiline_bullets(bullet_lines: List[str]) -> List[str]:
     Then optionally filter out “noise” lines.
     """
     merged_bullets = []
-    current_bullet = ""
+    # Parts of the in-progress bullet, joined once when it is flushed
+    current_parts = []
 
     for line in bullet_lines:
         line = line.rstrip()
         if not line:
             continue
 
-        # Check if line is a new bullet
-        is_bul = is_bullet_line(line)
-        clean_line = REMOVE_BULLET_PATTERN.sub("", line).strip() if is_bul else line
+        # Check if line is a new bullet; the marker end doubles as the slice point
+        marker_end = bullet_marker_end(line)
 
-        if is_bul:
+        if marker_end:
             # If we have an in-progress bullet, store it
-            if current_bullet:
-                merged_bullets.append(current_bullet.strip())
-            current_bullet = clean_line
+            if current_parts:
+                merged_bullets.append(" ".join(current_parts).strip())
+            clean_line = line[marker_end:]
+            current_parts = [clean_line] if clean_line else []
         else:
-            # Possibly merge into the previous bullet
-            if current_bullet and should_merge_lines(current_bullet, clean_line):
-                current_bullet += " " + clean_line
+            # Possibly merge into the previous bullet (only its tail matters)
+            if current_parts and should_merge_lines(current_parts[-1], line):
+                current_parts.append(line)
             else:
                 # Start a new bullet if old bullet is done
-                if current_bullet:
-                    merged_bullets.append(current_bullet.strip())
-                current_bullet = clean_line
+                if current_parts:
+                    merged_bullets.append(" ".join(current_parts).strip())
+                current_parts = [line]
 
     # Wrap up last bullet
-    if current_bullet:
-        merged_bullets.append(current_bullet.strip())
+    if current_parts:
+        merged_bullets.append(" ".join(current_parts).strip())
 
     # Filter out extremely short/noise lines if desired
     merged_bullets = filter_noise(merged_bullets)
@@ -407,73 +650,107 @@ def merge_multiline_bullets(bullet_lines: List[str]) -> List[str]:
 # 6) Skill Extraction
 # ----------------------------------------------------------
 
+TECH_SKILLS = frozenset({
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php',
+    'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab', 'perl',
+    'haskell', 'elixir', 'clojure', 'dart', 'html', 'css', 'sass', 'less',
+    'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'sqlite', 'django',
+    'flask', 'react', 'angular', 'vue', 'node', 'express', 'spring',
+    'laravel', 'rails', 'aws', 'azure', 'gcp', 'docker', 'kubernetes',
+    'terraform', 'ansible', 'puppet', 'chef', 'git', 'jenkins', 'ci/cd',
+    'linux', 'bash', 'powershell', 'windows server', 'macos', 'machine learning',
+    'ai', 'data science', 'pandas', 'numpy', 'tensorflow', 'pytorch', 'keras',
+    'agile', 'scrum', 'devops', 'oop', 'rest', 'api', 'microservices',
+    'graphql', 'grpc', 'tableau', 'power bi', 'excel', 'word', 'powerpoint',
+    'outlook', 'jira', 'confluence'
+})
+
+STOP_WORDS = frozenset({
+    'and', 'the', 'for', 'with', 'you', 'are', 'but', 'have', 'has', 'had',
+    'this', 'that', 'these', 'those', 'from', 'their', 'will', 'would',
+    'been', 'they', 'which', 'your', 'when', 'where', 'what', 'who', 'how',
+    'should', 'could', 'might', 'must', 'shall', 'can', 'may'
+})
+
+
+@functools.lru_cache(maxsize=32)
+def skills_pattern(skills: FrozenSet[str]) -> "re.Pattern[str]":
+    """
+    Compiles one regex that finds every single-word skill in `skills` as a
+    whole word, so the text is scanned once instead of once per skill.
+    The zero-width lookahead reports a match at every position, and longer
+    skills are listed first so they win when two start at the same place.
+    """
+    single_word = sorted((s for s in skills if ' ' not in s), key=len, reverse=True)
+    return re.compile(r'(?=\b(' + '|'.join(map(re.escape, single_word)) + r')\b)')
+
+
+def iter_phrases(tokens: List[str], stop_words: Iterable[str], max_words: int = 3) -> Iterator[str]:
+    """
+    Yields every run of 1..max_words consecutive tokens that contains
+    no stop word, e.g. "rest", "rest api", "rest api design".
+    """
+    for start in range(len(tokens)):
+        for end in range(start + 1, min(start + max_words, len(tokens)) + 1):
+            # Any longer window would contain this stop word too
+            if tokens[end - 1] in stop_words:
+                break
+            yield " ".join(tokens[start:end])
+
+
 def extract_skills_from_pdf(pdf_path: str, custom_skill_list: Optional[List[str]] = None) -> List[str]:
+    """
+    Reads the PDF's text and returns its skills (see `extract_skills_from_text`).
+    """
+    # Extract text. Read uncached: API uploads are one-off temp files, so
+    # caching them would only hold on to users' resumes
+    try:
+        text = _read_pdf_text(pdf_path)
+    except Exception as e:
+        logger.warning("Error reading PDF %s: %s", pdf_path, e)
+        return []
+
+    return extract_skills_from_text(text, custom_skill_list)
+
+
+def extract_skills_from_text(text: str, custom_skill_list: Optional[List[str]] = None) -> List[str]:
     """
     Return top matched + potential skills from text. 
     We look for known tech skills and also guess from 
     frequent noun phrases (up to 3 words).
+    Use this directly when the resume text is already extracted,
+    so the PDF is not parsed a second time.
     """
-    TECH_SKILLS = {
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php',
-        'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab', 'perl',
-        'haskell', 'elixir', 'clojure', 'dart', 'html', 'css', 'sass', 'less',
-        'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'sqlite', 'django',
-        'flask', 'react', 'angular', 'vue', 'node', 'express', 'spring',
-        'laravel', 'rails', 'aws', 'azure', 'gcp', 'docker', 'kubernetes',
-        'terraform', 'ansible', 'puppet', 'chef', 'git', 'jenkins', 'ci/cd',
-        'linux', 'bash', 'powershell', 'windows server', 'macos', 'machine learning',
-        'ai', 'data science', 'pandas', 'numpy', 'tensorflow', 'pytorch', 'keras',
-        'agile', 'scrum', 'devops', 'oop', 'rest', 'api', 'microservices',
-        'graphql', 'grpc', 'tableau', 'power bi', 'excel', 'word', 'powerpoint',
-        'outlook', 'jira', 'confluence'
-    }
-
-    STOP_WORDS = {
-        'and', 'the', 'for', 'with', 'you', 'are', 'but', 'have', 'has', 'had',
-        'this', 'that', 'these', 'those', 'from', 'their', 'will', 'would',
-        'been', 'they', 'which', 'your', 'when', 'where', 'what', 'who', 'how',
-        'should', 'could', 'would', 'might', 'must', 'shall', 'can', 'may'
-    }
-
     # Merge custom skills if any
+    skills = TECH_SKILLS
     if custom_skill_list:
-        TECH_SKILLS.update({s.lower() for s in custom_skill_list})
+        skills = TECH_SKILLS | {s.lower() for s in custom_skill_list}
 
-    # Extract text
-    try:
-        text = extract_text_from_pdf(pdf_path).lower()
-    except Exception as e:
-        print(f"Error reading PDF: {e}")
-        return []
+    text = text.lower()
 
-    found_skills = set()
-    # 1) Direct match for known skills
-    for skill in TECH_SKILLS:
-        if ' ' in skill:
-            if skill in text:
-                found_skills.add(skill)
-        else:
-            if re.search(r'\b' + re.escape(skill) + r'\b', text):
-                found_skills.add(skill)
+    # 1) Direct match for known skills: one regex pass for single words,
+    # plain substring checks for the few multi-word skills
+    skill_counts = Counter(m.group(1) for m in skills_pattern(skills).finditer(text))
+    skill_counts.update({
+        skill: text.count(skill) for skill in skills if ' ' in skill and skill in text
+    })
+    found_skills = set(skill_counts)
 
     # 2) Heuristic search for short noun phrases 
     # (up to 3 words) that might be skills
-    noun_phrases = re.findall(r'\b(?:[a-z]+\s){0,3}[a-z]+\b', text)
-    potential_skills = []
-    for phrase in noun_phrases:
-        # Exclude if in stop words, or already recognized
-        if phrase in found_skills:
-            continue
-        tokens = phrase.split()
-        if len(tokens) <= 3 and not any(t in STOP_WORDS for t in tokens):
-            potential_skills.append(phrase)
+    tokens = WORD_TOKEN_PATTERN.findall(text)
+    potential_skills = (
+        phrase for phrase in iter_phrases(tokens, STOP_WORDS)
+        # Exclude if already recognized
+        if phrase not in found_skills
+    )
 
     # 3) Frequency scoring for potential skills
     freq_counter = Counter(potential_skills)
     top_candidates = [skill for skill, _ in freq_counter.most_common(20)]
 
     # Sort known skills by frequency in text, then add top 10 guessed
-    sorted_known = sorted(found_skills, key=lambda s: (-text.count(s), s))
+    sorted_known = sorted(found_skills, key=lambda s: (-skill_counts[s], s))
     sorted_known.extend(top_candidates[:10])
 
     return sorted_known[:20]
@@ -499,7 +776,8 @@ def post_process_resume_data(resume_data: Dict) -> Dict:
             entry['title'] = entry['title'].strip()
 
             cleaned_bullets = []
-            current_sentence = ""
+            # Parts of the current sentence, joined once when it is complete
+            current_parts = []
 
             for bullet in entry['bullets']:
                 bullet = bullet.strip()
@@ -507,16 +785,17 @@ def post_process_resume_data(resume_data: Dict) -> Dict:
                     continue
 
                 # If the current sentence is incomplete, then merge
-                if current_sentence and INCOMPLETE_SENTENCE_PATTERN.search(current_sentence):
-                    current_sentence += " " + bullet
+                # (only its last part decides how it ends)
+                if current_parts and is_incomplete_sentence(current_parts[-1]):
+                    current_parts.append(bullet)
                 else:
                     # If we had a complete bullet, store it
-                    if current_sentence:
-                        cleaned_bullets.append(current_sentence)
-                    current_sentence = bullet
+                    if current_parts:
+                        cleaned_bullets.append(" ".join(current_parts))
+                    current_parts = [bullet]
 
-            if current_sentence:
-                cleaned_bullets.append(current_sentence)
+            if current_parts:
+                cleaned_bullets.append(" ".join(current_parts))
 
             entry['bullets'] = cleaned_bullets
 
@@ -548,7 +827,7 @@ if __name__ == "__main__":
         output = {
             "contacts": contacts,
             "sections": resume_sections,
-            "skills": extract_skills_from_pdf(pdf_path)
+            "skills": extract_skills_from_text(pdf_text)
         }
 
         # Post-process to unify incomplete sentences, etc.
@@ -24,12 +24,18 @@ This prevents overfitting to any one heuristic and ensures a balanced evaluation
 
 Structure
 ---------
-- generate_resume_score(bullets)
+- generate_resume_score(bullets, role)
     Main interface that runs all heuristics and returns a breakdown + final score.
 
+- score_resumes(resumes, role)
+    Scores many resumes (lists of bullets) in parallel worker processes.
+
 - dynamic_weighted_score(depth, star, pattern)
     Applies sigmoid-based diminishing return logic to each heuristic before combining them.
 
+- dynamic_weighted_score_batch(depth, star, pattern)
+    NumPy version of dynamic_weighted_score for scoring many resumes at once.
+
 - logistic_transform(x, x0, k)
     Smoothly transforms a heuristic score based on a defined target (`x0`) and steepness (`k`).
 
@@ -44,6 +50,12 @@ TODO: Add a feedback generator segment.
 import sys
 import os
 import math
+import functools
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Ensure Python can find 'core' and its submodules
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
@@ -52,13 +64,40 @@ from core.model.depth_model import DepthModel
 from core.heuristics.star_detection import predict_star_sentences
 from core.heuristics.pattern_matcher import predict_pattern_score
 
-depth_model = DepthModel()
+@functools.lru_cache(maxsize=1)
+def _get_depth_model() -> DepthModel:
+    """
+    Loads the depth model on first use, so importing this module stays cheap.
+    """
+    return DepthModel()
+
+# Servers can opt into loading the model at import time (warm start) with DEPTH_EAGER=1
+if os.environ.get("DEPTH_EAGER") == "1":
+    _get_depth_model()
 
-def generate_resume_score(bullets: list[str]) -> dict:
+# (x0, k, weight) per heuristic, shared by the scalar and batch scorers
+DEPTH_CURVE   = (0.8, 10, 0.45)   # saturates near 80%
+STAR_CURVE    = (0.6, 12, 0.35)   # saturates near 60%
+PATTERN_CURVE = (0.9, 10, 0.20)   # saturates near 90%
+
+def generate_resume_score(bullets: list[str], role: str = None) -> dict:
     """
     Runs all three heuristics on a list of resume bullets and returns
     a final composite resume score, as well as individual heuristic scores.
+    The pattern heuristic is scored against `role` (e.g. "Backend Developer");
+    without a role it is 0.
+    Results are cached, so re-scoring the same bullets is a lookup.
+    """
+    return dict(_score_cached(tuple(bullet.strip() for bullet in bullets), role))
+
+@functools.lru_cache(maxsize=1024)
+def _score_cached(bullets: tuple[str, ...], role: str = None) -> dict:
     """
+    Scores a tuple of stripped bullets for `role`. The models are only read here,
+    so the same bullets always produce the same result.
+    Callers get a copy, since the cached dict is shared.
+    """
+    bullets = list(bullets)
     if not bullets:
         return {
             "star": 0,
@@ -72,11 +111,11 @@ def generate_resume_score(bullets: list[str]) -> dict:
     star_score = star_result["star_percentage"] / 100  # 0–1
 
     # Depth Analysis
-    depth_result = depth_model.analyze_batch(bullets)
+    depth_result = _get_depth_model().analyze_batch(bullets)
     depth_score = depth_result["deep_percentage"] / 100  # 0–1
 
     # Pattern Matching
-    pattern_score = predict_pattern_score(bullets)      # 0–1
+    pattern_score = predict_pattern_score(bullets, role)  # 0–1
 
     # Apply our logistic weighting
     final_score = dynamic_weighted_score(depth_score, star_score, pattern_score)
@@ -88,6 +127,35 @@ def generate_resume_score(bullets: list[str]) -> dict:
         "final_score": round(final_score, 3)
     }
 
+def _init_worker():
+    """
+    Runs once in each scoring process: one torch thread per process so N
+    workers don't oversubscribe the cores, then warms up the depth model.
+    """
+    import torch
+
+    torch.set_num_threads(1)
+    _get_depth_model()
+
+def score_resumes(resumes: list[list[str]], role: str = None, max_workers: int = None) -> list[dict]:
+    """
+    Runs generate_resume_score on each resume's bullets across a process pool.
+    Results come back in the same order as `resumes`.
+    On Linux workers are forked, so a model already loaded in the parent
+    (e.g. with DEPTH_EAGER=1) is shared copy-on-write.
+    """
+    if len(resumes) <= 1:
+        return [generate_resume_score(bullets, role) for bullets in resumes]
+
+    context = None
+    # Fork only on Linux; macOS defaults to spawn because forking a process
+    # with torch/tokenizers already loaded is unsafe there
+    if sys.platform.startswith("linux"):
+        context = multiprocessing.get_context("fork")
+    max_workers = min(max_workers or os.cpu_count() or 1, len(resumes))
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker) as executor:
+        return list(executor.map(generate_resume_score, resumes, itertools.repeat(role)))
+
 def logistic_transform(x, x0=0.8, k=10):
     """
     Logistic (sigmoid) transform of x (0–1), saturating around x0.
@@ -105,22 +173,34 @@ def dynamic_weighted_score(depth, star, pattern):
       - Pattern saturates around 0.9 (90%), or adjust as you see fit
     """
     # Transform each metric to produce diminishing returns
-    depth_sig   = logistic_transform(depth, x0=0.8, k=10)   # saturates near 80%
-    star_sig    = logistic_transform(star,  x0=0.6, k=12)   # saturates near 60%
-    pattern_sig = logistic_transform(pattern, x0=0.9, k=10) # saturates near 90%
-
-    # Weights for each metric (customize to your preference)
-    w_depth   = 0.45
-    w_star    = 0.35
-    w_pattern = 0.20
+    depth_sig   = logistic_transform(depth, x0=DEPTH_CURVE[0], k=DEPTH_CURVE[1])
+    star_sig    = logistic_transform(star,  x0=STAR_CURVE[0], k=STAR_CURVE[1])
+    pattern_sig = logistic_transform(pattern, x0=PATTERN_CURVE[0], k=PATTERN_CURVE[1])
 
     # Weighted sum of transformed scores
     return (
-        depth_sig * w_depth +
-        star_sig  * w_star +
-        pattern_sig * w_pattern
+        depth_sig * DEPTH_CURVE[2] +
+        star_sig  * STAR_CURVE[2] +
+        pattern_sig * PATTERN_CURVE[2]
     )
 
+def dynamic_weighted_score_batch(depth, star, pattern) -> np.ndarray:
+    """
+    Vectorized dynamic_weighted_score: takes arrays of per-resume scores
+    (0–1) and returns an array of final scores in float32.
+    Use the scalar version for a single resume; NumPy's per-call
+    overhead outweighs the vector math when N=1.
+    """
+    total = np.zeros(np.shape(depth), dtype=np.float32)
+    for scores, (x0, k, weight) in (
+        (depth, DEPTH_CURVE),
+        (star, STAR_CURVE),
+        (pattern, PATTERN_CURVE),
+    ):
+        x = np.asarray(scores, dtype=np.float32)
+        total += np.float32(weight) / (np.float32(1.0) + np.exp(np.float32(-k) * (x - np.float32(x0))))
+    return total
+
 
 if __name__ == "__main__":
     sample_bullets = [
@@ -130,7 +210,7 @@ if __name__ == "__main__":
         "Built a dashboard for tracking KPIs."
     ]
 
-    results = generate_resume_score(sample_bullets)
+    results = generate_resume_score(sample_bullets, role="Backend Developer")
 
     print("=== Resume Score Breakdown ===")
     for k, v in results.items():
@@ -47,15 +47,47 @@ Each bullet receives a 'depth score' (0-1). We then factor that score in the ana
 import joblib
 import sys
 import os
-from sentence_transformers import SentenceTransformer
+import functools
+import numpy as np
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from core.extractor import extract_text_from_pdf, extract_sections, merge_multiline_bullets
+from core.model.depth_model import depth_model_paths
+from core.model.embedders import get_embedder
 
-# Load sentence transformer and trained classifier
-EMBEDDING_MODEL = SentenceTransformer("sentence-transformers/all-mpnet-base-v2")
-MODEL_PATH = "core/model/depth_model.pkl"
-depth_clf = joblib.load(MODEL_PATH)
+# Load sentence transformer and trained classifier (DEPTH_FAST=1 picks the static embedder)
+_EMBEDDER_NAME, _MODEL_PATH = depth_model_paths()
+EMBEDDING_MODEL = get_embedder(_EMBEDDER_NAME)
+
+@functools.lru_cache(maxsize=1)
+def _depth_clf():
+    """
+    Loads the depth classifier on first use. Its arrays are memory-mapped,
+    so worker processes share the same pages instead of each holding a copy.
+    """
+    return joblib.load(_MODEL_PATH, mmap_mode='r')
+
+# Bullet text -> embedding; repeated bullets skip the MPNet forward pass.
+# Oldest entries are dropped once the cache is full.
+EMBEDDING_CACHE_SIZE = 8192
+_embedding_cache = {}
+
+def _encode_cached(sentences):
+    """
+    Encodes sentences with EMBEDDING_MODEL, only running the model on
+    sentences that are not already cached. Returns one row per sentence.
+    """
+    misses = list(dict.fromkeys(s for s in sentences if s not in _embedding_cache))
+    fresh = {}
+    if misses:
+        fresh = dict(zip(misses, EMBEDDING_MODEL.encode(misses, convert_to_numpy=True)))
+    embeddings = np.vstack([fresh[s] if s in fresh else _embedding_cache[s] for s in sentences])
+
+    for sentence, embedding in fresh.items():
+        if len(_embedding_cache) >= EMBEDDING_CACHE_SIZE:
+            del _embedding_cache[next(iter(_embedding_cache))]
+        _embedding_cache[sentence] = embedding
+    return embeddings
 
 def predict_depth_sentences(sentences):
     """
@@ -70,8 +102,8 @@ def predict_depth_sentences(sentences):
     if not sentences:
         return {"deep_count": 0, "total_sentences": 0, "deep_percentage": 0}
 
-    embeddings = EMBEDDING_MODEL.encode(sentences)
-    predictions = depth_clf.predict(embeddings)
+    embeddings = _encode_cached(sentences)
+    predictions = _depth_clf().predict(embeddings)
 
     deep_count = sum(predictions)
     total_sentences = len(sentences)
@@ -103,8 +135,11 @@ if __name__ == "__main__":
     print(f"Depth Percentage: {results['deep_percentage']}%\n")
 
     print("=== Bullet Point Classification ===")
-    for bullet in all_bullets:
-        embedding = EMBEDDING_MODEL.encode([bullet])
-        prediction = depth_clf.predict(embedding)[0]
+    # Embeddings were cached by predict_depth_sentences above
+    predictions = _depth_clf().predict(_encode_cached(all_bullets)) if all_bullets else []
+    lines = []
+    for bullet, prediction in zip(all_bullets, predictions):
         classification = "🧠 Deep" if prediction == 1 else "⚪ Shallow"
-        print(f"- {bullet} → {classification}")
+        lines.append(f"- {bullet} → {classification}")
+    # One write for the whole listing instead of a print per bullet
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -1,30 +1,61 @@
 import re
+import string
+import functools
 from core.roles.job_roles import JOB_ROLES
 
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+# ASCII fast path for preprocess_text: one translate call lowercases and
+# drops every character PUNCTUATION_PATTERN would remove
+_ASCII_PUNCTUATION = "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c == "_" or c.isspace())
+)
+_ASCII_PREPROCESS_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, _ASCII_PUNCTUATION)
+
 def preprocess_text(text: str) -> str:
     """
     Normalize the bullet text by lowercasing all words and removing punctuation.
     """
+    if text.isascii():
+        return text.translate(_ASCII_PREPROCESS_TABLE)
     text = text.lower()
-    text = re.sub(r'[^\w\s]', '', text)
+    text = PUNCTUATION_PATTERN.sub('', text)
     return text
 
+def _lowercase_role_keywords(role_data: dict):
+    """
+    Lowercased (required, recommended technical) keyword lists for one role.
+    """
+    required = role_data.get("required_skills", [])
+    # Recommended skills may be nested under "recommended_skills" with a "technical" field.
+    recommended = role_data.get("recommended_skills", {}).get("technical", [])
+    return [kw.lower() for kw in required], [kw.lower() for kw in recommended]
+
+# Role name -> lowercased keyword lists, built once at import.
+# If a role appears in several categories, the first one wins.
+_ROLE_KEYWORDS_LOWER = {}
+for _roles in JOB_ROLES.values():
+    for _role, _role_data in _roles.items():
+        if _role not in _ROLE_KEYWORDS_LOWER:
+            _ROLE_KEYWORDS_LOWER[_role] = _lowercase_role_keywords(_role_data)
+
 def get_keywords_for_role(role: str):
     """
     Retrieve the expected skills for a given role from JOB_ROLES.
-    Searches through all categories and returns:
+    Returns:
       - required_keywords: list of required skills
       - recommended_keywords: list of tech-related recommended skills
     If role is not found, returns empty lists.
+    The lists are shared, so callers must not modify them.
     """
-    for category, roles in JOB_ROLES.items():
-        if role in roles:
-            role_data = roles[role]
-            required = role_data.get("required_skills", [])
-            # Recommended skills may be nested under "recommended_skills" with a "technical" field.
-            recommended = role_data.get("recommended_skills", {}).get("technical", [])
-            return [kw.lower() for kw in required], [kw.lower() for kw in recommended]
-    return [], []
+    return _ROLE_KEYWORDS_LOWER.get(role, ([], []))
+
+@functools.lru_cache(maxsize=None)
+def keyword_pattern(keyword: str) -> re.Pattern:
+    """
+    Compiled whole-word pattern for a keyword, built once per keyword.
+    """
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
 
 def match_keywords(text: str, keywords: list) -> int:
     """
@@ -33,7 +64,9 @@ def match_keywords(text: str, keywords: list) -> int:
     """
     count = 0
     for keyword in keywords:
-        if re.search(r'\b' + re.escape(keyword) + r'\b', text):
+        # Most keywords are not even a substring of the bullet; only run
+        # the word-boundary regex on the ones that are
+        if keyword in text and keyword_pattern(keyword).search(text):
             count += 1
     return count
 
@@ -47,6 +80,13 @@ def evaluate_pattern(bullet: str, role: str) -> float:
     
     required_keywords, recommended_keywords = get_keywords_for_role(role)
     
+    final_score = score_keywords(processed_bullet, required_keywords, recommended_keywords)
+    return round(final_score, 3)
+
+def score_keywords(processed_bullet: str, required_keywords: list, recommended_keywords: list) -> float:
+    """
+    Role relevance score of an already preprocessed bullet against the given keyword lists.
+    """
     total_required = len(required_keywords)
     total_recommended = len(recommended_keywords)
     
@@ -58,8 +98,22 @@ def evaluate_pattern(bullet: str, role: str) -> float:
     rec_score = matched_recommended / total_recommended if total_recommended > 0 else 0
     
     # Weight the scores (e.g., 70% required, 30% recommended)
-    final_score = 0.7 * req_score + 0.3 * rec_score
-    return round(final_score, 3)
+    return 0.7 * req_score + 0.3 * rec_score
+
+def predict_pattern_score(bullets: list, role: str) -> float:
+    """
+    Average pattern score (0-1) of a resume's bullets for `role`.
+    An unknown role has no keywords, so it scores 0 (as in evaluate_pattern).
+    """
+    if not bullets:
+        return 0.0
+
+    required_keywords, recommended_keywords = get_keywords_for_role(role)
+    total = sum(
+        score_keywords(preprocess_text(bullet), required_keywords, recommended_keywords)
+        for bullet in bullets
+    )
+    return round(total / len(bullets), 3)
 
 if __name__ == "__main__":
     sample_bullet = "Developed RESTful APIs using Python and Flask, integrating with SQL databases."
@@ -42,20 +42,23 @@ This result is factored into the overall scoring of the resume, often with a wei
 with other heuristics (Depth, Role Relevance, etc.).
 """
 
-import joblib
 import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from core.extractor import extract_text_from_pdf, extract_sections, merge_multiline_bullets
+from core.model.star_model import STARModel
 
-# Load the trained STAR model and vectorizer
+# Trained STAR model and vectorizer, loaded on first use
 MODEL_PATH = "core/model/star_model.pkl"
 VECTORIZER_PATH = "core/model/star_vectorizer.pkl"
 
-# Load model and vectorizer
-model = joblib.load(MODEL_PATH)
-vectorizer = joblib.load(VECTORIZER_PATH)
+def _predict_star(sentences):
+    """
+    Returns 1 (STAR) / 0 (not STAR) for each sentence.
+    The model and vectorizer are loaded once per process and shared with STARModel.
+    """
+    return STARModel(MODEL_PATH, VECTORIZER_PATH).predict_batch(sentences).astype(int)
 
 def predict_star_sentences(sentences):
     """
@@ -70,14 +73,11 @@ def predict_star_sentences(sentences):
     if not sentences:
         return {"star_count": 0, "total_sentences": 0, "star_percentage": 0}
 
-    # Convert sentences to TF-IDF features
-    sentences_vectorized = vectorizer.transform(sentences)
-
     # Predict STAR classification (1 = STAR, 0 = Not STAR)
-    predictions = model.predict(sentences_vectorized)
+    predictions = _predict_star(sentences)
 
     # Count STAR sentences
-    star_count = sum(predictions)
+    star_count = int(predictions.sum())
     total_sentences = len(sentences)
     star_percentage = (star_count / total_sentences) * 100 if total_sentences else 0
 
@@ -112,7 +112,10 @@ if __name__ == "__main__":
 
     # Print classification for each bullet point
     print("=== Bullet Point Classification ===")
-    for bullet in all_bullets:
-        prediction = model.predict(vectorizer.transform([bullet]))[0]
+    predictions = _predict_star(all_bullets) if all_bullets else []
+    lines = []
+    for bullet, prediction in zip(all_bullets, predictions):
         classification = "✅ STAR" if prediction == 1 else "❌ Not STAR"
-        print(f"- {bullet} → {classification}")
\ No newline at end of file
+        lines.append(f"- {bullet} → {classification}")
+    # One write for the whole listing instead of a print per bullet
+    sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
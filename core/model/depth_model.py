@@ -8,22 +8,69 @@ This allows the rest of the Resume IQ system to easily evaluate bullet points fo
 
 import os
 import joblib
-from sentence_transformers import SentenceTransformer
+import numpy as np
+from scipy.special import expit
+from core.model.embedders import MPNET_NAME, get_embedder
+
+EMBEDDER_NAME = MPNET_NAME
+MODEL_PATH = "core/model/depth_model.pkl"
+
+# Fast mode: a static (lookup + mean-pool) embedder with a classifier trained
+# on its vectors. Much cheaper than MPNet on CPU, at some cost in accuracy.
+# Enable with DEPTH_FAST=1; train it with `depth_train_model.py --fast`.
+FAST_EMBEDDER_NAME = "sentence-transformers/static-retrieval-mrl-en-v1"
+FAST_MODEL_PATH = "core/model/depth_model_fast.pkl"
+
+def use_fast_mode() -> bool:
+    """
+    True if DEPTH_FAST=1 is set in the environment.
+    """
+    return os.environ.get("DEPTH_FAST") == "1"
+
+def depth_model_paths(fast=None) -> tuple[str, str]:
+    """
+    (embedder_name, model_path) of the depth classifier to use.
+    `fast` defaults to the DEPTH_FAST environment variable.
+    """
+    if fast is None:
+        fast = use_fast_mode()
+    if fast:
+        return FAST_EMBEDDER_NAME, FAST_MODEL_PATH
+    return EMBEDDER_NAME, MODEL_PATH
 
 class DepthModel:
-    def __init__(self, model_path="core/model/depth_model.pkl"):
+    def __init__(self, model_path=None, fast=None):
         """
         Loads the sentence-transformer model and the trained depth classifier.
+        `fast` defaults to the DEPTH_FAST environment variable.
         """
-        self.embedder = SentenceTransformer("sentence-transformers/all-mpnet-base-v2")
-        self.classifier = joblib.load(model_path)
+        embedder_name, default_model_path = depth_model_paths(fast)
+        self.embedder = get_embedder(embedder_name)
+        # Memory-mapped so processes loading the same model share its arrays
+        self.classifier = joblib.load(model_path or default_model_path, mmap_mode='r')
+
+        # A binary logistic regression is just sigmoid(X @ w + b); keeping
+        # w and b as float32 lets _score skip sklearn's validation and casts
+        self._weights = None
+        if hasattr(self.classifier, "coef_") and list(getattr(self.classifier, "classes_", [])) == [0, 1]:
+            self._weights = self.classifier.coef_.astype(np.float32).ravel()
+            self._bias = np.float32(self.classifier.intercept_[0])
+
+    def _score(self, sentences: list[str]) -> np.ndarray:
+        """
+        Encodes the sentences once and returns P(deep) for each of them.
+        Every public prediction method is derived from this.
+        """
+        embeddings = self.embedder.encode(sentences, batch_size=32, convert_to_numpy=True)
+        if self._weights is None:
+            return self.classifier.predict_proba(embeddings)[:, 1]
+        return expit(embeddings.astype(np.float32, copy=False) @ self._weights + self._bias)
 
     def predict_proba(self, bullet: str) -> float:
         """
         Returns probability that a bullet is 'deep'.
         """
-        embedding = self.embedder.encode([bullet])
-        return self.classifier.predict_proba(embedding)[0][1]
+        return self._score([bullet])[0]
 
     def is_deep(self, bullet: str, threshold=0.5) -> bool:
         """
@@ -35,8 +82,8 @@ class DepthModel:
         """
         Returns 0/1 predictions for a list of bullets.
         """
-        embeddings = self.embedder.encode(sentences)
-        return self.classifier.predict(embeddings)
+        # Same rule as classifier.predict: deep only when P(deep) > 0.5
+        return (self._score(sentences) > 0.5).astype(np.int64)
 
     def analyze_batch(self, sentences: list[str]) -> dict:
         """
@@ -46,7 +93,7 @@ class DepthModel:
             return {"deep_count": 0, "total_sentences": 0, "deep_percentage": 0}
 
         predictions = self.predict_batch(sentences)
-        deep_count = sum(predictions)
+        deep_count = int(predictions.sum())
         total = len(sentences)
         percent = (deep_count / total) * 100 if total else 0
 
@@ -64,13 +111,16 @@ if __name__ == "__main__":
         "Developed an SQL server using SQL and Python."
     ]
 
+    # Encode once; both listings below come from the same probabilities
+    probabilities = dm._score(bullets)
+
     print("=== Individual Probabilities ===")
-    for b in bullets:
-        print(f"- {b} → {dm.predict_proba(b):.3f}")
+    for b, prob in zip(bullets, probabilities):
+        print(f"- {b} → {prob:.3f}")
 
     print("\n=== Batch Classification ===")
-    for b, pred in zip(bullets, dm.predict_batch(bullets)):
-        print(f"- {b} → {'🧠 Deep' if pred == 1 else '⚪ Shallow'}")
+    for b, prob in zip(bullets, probabilities):
+        print(f"- {b} → {'🧠 Deep' if prob > 0.5 else '⚪ Shallow'}")
 
     print("\n=== Summary ===")
     print(dm.analyze_batch(bullets))
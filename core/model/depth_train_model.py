@@ -41,9 +41,14 @@ D. Model Evaluation
 - The data is split into 80% training and 20% test
 - `classification_report()` is printed to evaluate performance (precision, recall, f1-score)
 
+Embeddings are cached on disk per embedder (`embeddings_cache_<hash>.npz`),
+so re-training after adding a few labelled bullets only encodes the new ones.
+
 E. Saving the Model
 - The trained classifier is saved to `depth_model.pkl`
 - Can be loaded later using `depth_model.py` wrapper for prediction
+- `--fast` trains the companion classifier on static embeddings instead
+  (`depth_model_fast.pkl`, used when DEPTH_FAST=1)
 
 Example Inference Flow
 -----------------------
@@ -55,6 +60,8 @@ Example Inference Flow
 
 
 import os
+import sys
+import hashlib
 import joblib
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
@@ -62,9 +69,15 @@ from sklearn.metrics import classification_report
 from sentence_transformers import SentenceTransformer
 import numpy as np
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+from core.model.depth_model import FAST_EMBEDDER_NAME
+
 DATA_PATH = os.path.join(os.path.dirname(__file__), '../data/depth_data.txt')
 MODEL_PATH = os.path.join(os.path.dirname(__file__), 'depth_model.pkl')
 VECTORIZER_PATH = os.path.join(os.path.dirname(__file__), 'depth_vectorizer.pkl')
+FAST_MODEL_PATH = os.path.join(os.path.dirname(__file__), 'depth_model_fast.pkl')
+# Below this many sentences, starting a CPU worker pool costs more than it saves
+MULTI_PROCESS_MIN_SENTENCES = 2000
 
 def load_data():
     texts, labels = [], []
@@ -80,14 +93,68 @@ def load_data():
                 labels.append(int(label))
     return texts, labels
 
-def train_model():
+def _digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def encode_on_cpu_pool(model, sentences):
+    """
+    Encodes on CPU with one sentence-transformer worker process per two cores.
+    Each worker is limited to two threads, so the workers don't fight over cores.
+    """
+    workers = max(1, (os.cpu_count() or 2) // 2)
+    previous_threads = os.environ.get("OMP_NUM_THREADS")
+    os.environ["OMP_NUM_THREADS"] = "2"  # read by the spawned workers' torch
+    try:
+        pool = model.start_multi_process_pool(target_devices=["cpu"] * workers)
+    finally:
+        if previous_threads is None:
+            del os.environ["OMP_NUM_THREADS"]
+        else:
+            os.environ["OMP_NUM_THREADS"] = previous_threads
+    try:
+        return model.encode_multi_process(sentences, pool, batch_size=64, chunk_size=500)
+    finally:
+        model.stop_multi_process_pool(pool)
+
+def encode_with_cache(embedder_name, sentences):
+    """
+    Encodes sentences with the named sentence-transformer, reusing embeddings
+    saved by earlier runs. Only sentences missing from the cache are encoded,
+    and the model is not even loaded when every sentence is cached.
+    """
+    cache_path = os.path.join(os.path.dirname(__file__), f"embeddings_cache_{_digest(embedder_name)[:12]}.npz")
+    cache = {}
+    if os.path.exists(cache_path):
+        # Read everything and close the file before it is overwritten below
+        with np.load(cache_path) as data:
+            cache = dict(data)
+
+    keys = [_digest(sentence) for sentence in sentences]
+    missing = {key: sentence for key, sentence in zip(keys, sentences) if key not in cache}
+    if missing:
+        print(f"Encoding {len(missing)} sentences not in the embedding cache.")
+        model = SentenceTransformer(embedder_name)
+        if model.device.type == "cuda":
+            # Match inference, where shared embedders run in FP16 on CUDA
+            model.half()
+        texts = list(missing.values())
+        if model.device.type == "cpu" and len(texts) >= MULTI_PROCESS_MIN_SENTENCES and (os.cpu_count() or 1) > 2:
+            encoded = encode_on_cpu_pool(model, texts)
+        else:
+            encoded = model.encode(texts, batch_size=64, convert_to_numpy=True, show_progress_bar=False)
+        # FP16 embeddings from the GPU are widened once for LogisticRegression.fit
+        cache.update(zip(missing, encoded.astype(np.float32, copy=False)))
+        np.savez_compressed(cache_path, **cache)
+
+    return np.vstack([cache[key] for key in keys])
+
+def train_model(embedder_name='all-mpnet-base-v2', model_path=MODEL_PATH):
     # Load data
     X, y = load_data()
     print(f"Loaded {len(X)} examples.")
 
     # Encode text using sentence-transformers
-    model = SentenceTransformer('all-mpnet-base-v2')
-    embeddings = model.encode(X)
+    embeddings = encode_with_cache(embedder_name, X)
 
     # Train/test split
     X_train, X_test, y_train, y_test = train_test_split(embeddings, y, test_size=0.2, random_state=42)
@@ -101,8 +168,11 @@ def train_model():
     print(classification_report(y_test, y_pred))
 
     # Save model
-    joblib.dump(clf, MODEL_PATH)
-    print(f"Model saved to {MODEL_PATH}")
+    joblib.dump(clf, model_path)
+    print(f"Model saved to {model_path}")
 
 if __name__ == "__main__":
-    train_model()
+    if "--fast" in sys.argv[1:]:
+        train_model(FAST_EMBEDDER_NAME, FAST_MODEL_PATH)
+    else:
+        train_model()
@@ -1,33 +1,42 @@
+import os
 import pandas as pd
 import re
 
 CSV_PATH = "core/data/resume.csv"
+# The second column, holding the raw resume text
+RESUME_TEXT_COLUMN = "Resume_str"
 OUTPUT_FILE = "core/data/unlabeled_bullets.txt"
 
+# Compiled once at import instead of on every extract_chunks call
+SPLIT_PATTERN = re.compile(r'[\n•●\-\–]+')
+# Start of the trailing junk cleanup_line cuts off. Each cut used to be a
+# separate regex pass; since every one of them removes everything from its
+# match to the end, cutting once at the earliest match gives the same result.
+CLEANUP_PATTERN = re.compile(r'(?:0[1-9]|1[0-2])/\d{4}|Company Name|Education|Firms?')
+# Kept chunks must start with one of these. Checked with str.startswith,
+# a prefix test exactly like the old ^(...) regex (so "Ledger" passes via "Led").
+ACTION_VERBS = (
+    "Managed", "Developed", "Led", "Created", "Handled", "Organized", "Coordinated",
+    "Designed", "Built", "Worked", "Conducted", "Implemented", "Executed", "Assisted",
+    "Served", "Enhanced", "Drafted", "Reduced", "Increased", "Collaborated", "Partnered",
+    "Presented", "Improved", "Wrote", "Participated", "Defined", "Automated", "Integrated",
+    "Supervised", "Monitored", "Resolved", "Recommended", "Promoted", "Maintained",
+    "Analyzed", "Directed", "Prepared", "Reviewed",
+)
+
 def cleanup_line(line: str) -> str:
     """
     Removes trailing date patterns, references to 'Company Name', 'Education', 'Firms', etc.
     so that we keep only the actual bullet portion.
     """
+    # Everything from the first date ("06/2013 to 02/2016", "07/2015"),
+    # "Company Name", "Education" or "Firm(s)" onward is dropped
+    match = CLEANUP_PATTERN.search(line)
+    if match:
+        line = line[:match.start()]
 
-    # 1) Remove trailing date patterns like "06/2013   to   02/2016"
-    #    or single date references like "07/2015"
-    line = re.sub(r'(0[1-9]|1[0-2])/\d{4}\s*to\s*(0[1-9]|1[0-2])/\d{4}.*', '', line)
-    line = re.sub(r'(0[1-9]|1[0-2])/\d{4}.*', '', line)
-
-    # 2) Remove trailing references to "Company Name" and anything after
-    line = re.split(r'Company Name\s*.*', line)[0]
-
-    # 3) Remove trailing "Education" section references
-    line = re.split(r'Education\s*.*', line)[0]
-
-    # 4) Remove trailing "Firms" references if any
-    line = re.split(r'Firms?\s*[:]?.*', line)[0]
-
-    # 5) Remove extra spacing
-    line = line.strip()
-
-    return line
+    # Remove extra spacing
+    return line.strip()
 
 
 def extract_chunks(text: str):
@@ -36,7 +45,7 @@ def extract_chunks(text: str):
     then cleans up each chunk to remove extraneous references.
     """
     # Split on newlines or bullet-like separators
-    chunks = re.split(r'[\n•●\-\–]+', text)
+    chunks = SPLIT_PATTERN.split(text)
     clean_chunks = []
 
     for chunk in chunks:
@@ -48,28 +57,51 @@ def extract_chunks(text: str):
 
         # Heuristic: Keep lines that are at least 6 words
         # AND start with an action verb or capital letter
-        if len(chunk.split()) >= 6 and re.match(
-            r"^(Managed|Developed|Led|Created|Handled|Organized|Coordinated|Designed|Built|Worked|Conducted|Implemented|Executed|Assisted|Served|Enhanced|Drafted|Reduced|Increased|Collaborated|Partnered|Presented|Improved|Wrote|Participated|Defined|Automated|Integrated|Supervised|Monitored|Resolved|Recommended|Promoted|Maintained|Analyzed|Directed|Prepared|Reviewed)",
-            chunk
-        ):
+        if chunk.startswith(ACTION_VERBS) and len(chunk.split()) >= 6:
             clean_chunks.append(chunk)
 
     return clean_chunks
 
 
+def read_resume_csv(path: str, usecols=None) -> pd.DataFrame:
+    """
+    Reads the resume CSV (optionally only the `usecols` column names). With
+    FAST_IO=1 and pyarrow installed, uses pyarrow's multithreaded CSV parser;
+    otherwise pandas' default C parser.
+    """
+    if os.environ.get("FAST_IO") == "1":
+        try:
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            pass
+        else:
+            # Called directly rather than through pd.read_csv(engine="pyarrow"):
+            # resume cells are quoted and span many lines, and pandas never
+            # turns on newlines_in_values for Arrow's parser
+            table = pa_csv.read_csv(
+                path,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(include_columns=usecols or []),
+            )
+            return table.to_pandas()
+    return pd.read_csv(path, usecols=usecols)
+
+
 def extract_from_resume_csv():
-    df = pd.read_csv(CSV_PATH)
+    # Only the raw resume text column is used. It is selected by name: the
+    # pyarrow engine rejects integer column positions in usecols.
+    df = read_resume_csv(CSV_PATH, usecols=[RESUME_TEXT_COLUMN])
 
-    all_bullets = []
+    # Deduplicated as we go, so repeated bullets are never stored twice
+    all_bullets = set()
 
-    # We assume the second column has the raw resume text
-    for _, row in df.iterrows():
-        resume_text = str(row[1])
+    # Iterating the column directly avoids building a Series per row like iterrows() does
+    for resume_text in df[RESUME_TEXT_COLUMN].astype(str):
         bullets = extract_chunks(resume_text)
-        all_bullets.extend(bullets)
+        all_bullets.update(bullets)
 
-    # Remove duplicates & sort for consistency
-    unique_bullets = sorted(set(all_bullets))
+    # Sort the (already unique) bullets for consistency
+    unique_bullets = sorted(all_bullets)
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         for bullet in unique_bullets:
@@ -1,47 +1,58 @@
 import os
 import sys
 import glob
+from concurrent.futures import ProcessPoolExecutor
 
 # Ensure Python sees extractor.py
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from extractor import (
-    extract_text_from_pdf,
+    iter_pdf_lines,
     extract_sections,
 )
 
 PDF_FOLDER = "core/data/resume_pdfs/INFORMATION-TECHNOLOGY"
 OUTPUT_FILE = "core/data/unlabeled_bullets.txt"
 
-def parse_folder_of_pdfs(pdf_folder: str, output_file: str):
-    all_bullets = []
+def bullets_from_pdf(pdf_path: str) -> list:
+    """
+    Returns the bullets (6+ words) of one PDF. Runs in a worker process;
+    errors are reported and swallowed so one bad PDF doesn't stop the pool.
+    """
+    print(f"Parsing: {pdf_path}")
+    bullets = []
+    try:
+        # 1) + 2) Stream the PDF's lines straight into the section parser
+        resume_sections = extract_sections(iter_pdf_lines(pdf_path))
+
+        # 3) Gather bullets
+        for section in resume_sections:
+            for entry in section.get("entries", []):
+                for bullet in entry.get("bullets", []):
+                    bullet = bullet.strip()
+                    # Filter out short lines (< 6 words, for example)
+                    if len(bullet.split()) >= 6:
+                        bullets.append(bullet)
+    except Exception as e:
+        print(f"Error processing {pdf_path}: {e}")
+    return bullets
+
+def parse_folder_of_pdfs(pdf_folder: str, output_file: str, max_workers: int = None):
+    # Deduplicated as we go, so repeated bullets are never stored twice
+    all_bullets = set()
 
     pdf_paths = glob.glob(os.path.join(pdf_folder, "*.pdf"))
     if not pdf_paths:
         print(f"No PDFs found in {pdf_folder}")
         return
 
-    for pdf_path in pdf_paths:
-        print(f"Parsing: {pdf_path}")
-        try:
-            # 1) Extract raw text
-            pdf_text = extract_text_from_pdf(pdf_path)
-            # 2) Convert raw text to structured sections
-            resume_sections = extract_sections(pdf_text)
-
-            # 3) Gather bullets
-            for section in resume_sections:
-                for entry in section.get("entries", []):
-                    for bullet in entry.get("bullets", []):
-                        bullet = bullet.strip()
-                        # Filter out short lines (< 6 words, for example)
-                        if len(bullet.split()) >= 6:
-                            all_bullets.append(bullet)
-        except Exception as e:
-            print(f"Error processing {pdf_path}: {e}")
-
-    # 4) Deduplicate & sort
-    unique_bullets = sorted(set(all_bullets))
+    # PDF parsing is CPU-bound and independent per file, so spread it over processes
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for bullets in executor.map(bullets_from_pdf, pdf_paths, chunksize=4):
+            all_bullets.update(bullets)
+
+    # 4) Sort the (already unique) bullets
+    unique_bullets = sorted(all_bullets)
 
     # 5) Write to unlabeled_bullets.txt
     with open(output_file, "w", encoding="utf-8") as f:
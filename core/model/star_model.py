@@ -6,7 +6,44 @@ Wrapper for the trained model (star_model.pk) and vectorizer (star_vectorizer.pk
 This allows the rest of the Resume IQ system to easily evaluate bullet points for technical and methodological depth.
 """
 
+import functools
+import math
+from collections import Counter
+
 import joblib
+import numpy as np
+
+@functools.lru_cache(maxsize=None)
+def get_star_model(model_path="core/model/star_model.pkl", vectorizer_path="core/model/star_vectorizer.pkl"):
+    """
+    Loads the STAR classifier and vectorizer once per process and returns them
+    as (model, vectorizer). Arrays are memory-mapped so forked workers share them.
+    """
+    model = joblib.load(model_path, mmap_mode='r')
+    vectorizer = joblib.load(vectorizer_path, mmap_mode='r')
+    return model, vectorizer
+
+@functools.lru_cache(maxsize=None)
+def _star_linear_weights(model_path, vectorizer_path):
+    """
+    Folds the vectorizer's idf_ into the classifier's weights so a sentence
+    can be scored straight from its tokens, without building a sparse matrix.
+    Returns (analyzer, {term: (coef * idf, idf)}, intercept), or None if the
+    vectorizer/model setup is not the plain TF-IDF (l2) + binary LR it was trained as.
+    """
+    model, vectorizer = get_star_model(model_path, vectorizer_path)
+    if (vectorizer.norm != "l2" or vectorizer.sublinear_tf or vectorizer.binary
+            or not vectorizer.use_idf or list(getattr(model, "classes_", [])) != [0, 1]
+            or not hasattr(model, "coef_")):
+        return None
+
+    coef = model.coef_.ravel()
+    idf = vectorizer.idf_
+    term_weights = {
+        term: (float(coef[index] * idf[index]), float(idf[index]))
+        for term, index in vectorizer.vocabulary_.items()
+    }
+    return vectorizer.build_analyzer(), term_weights, float(model.intercept_[0])
 
 class STARModel:
     """
@@ -17,21 +54,44 @@ class STARModel:
         star_vectorizer.pkl - Contains the TF-IDF vectorizer used to convert text into numerical features.
     """
 
-    def __init__(self, model_path="model/star_model.pkl", vectorizer_path="model/star_vectorizer.pkl"):
+    def __init__(self, model_path="core/model/star_model.pkl", vectorizer_path="core/model/star_vectorizer.pkl"):
         """
-        Initializes the STAR model and vectorizer.
+        Initializes the STAR model and vectorizer (shared across instances).
         """
-        self.model = joblib.load("core/model/star_model.pkl")
-        self.vectorizer = joblib.load("core/model/star_vectorizer.pkl")
+        self.model, self.vectorizer = get_star_model(model_path, vectorizer_path)
+        self._linear = _star_linear_weights(model_path, vectorizer_path)
 
 
     def predict(self, text):
         """
         Predicts whether a sentence is STAR-compliant.
         """
-        text_vectorized = self.vectorizer.transform([text])
-        prediction = self.model.predict(text_vectorized)
-        return prediction[0] == 1  # Returns True if STAR-compliant, False otherwise
+        return self.predict_batch([text])[0]  # Returns True if STAR-compliant, False otherwise
+
+    def predict_batch(self, texts):
+        """
+        Predicts STAR compliance for many sentences. Returns a boolean array aligned with `texts`.
+        Same decision as model.predict(vectorizer.transform(texts)): the
+        TF-IDF row is l2-normalized, so logit = b + (sum tf * coef * idf) / ||tf * idf||.
+        """
+        if not texts:
+            return np.zeros(0, dtype=bool)
+        if self._linear is None:
+            return self.model.predict(self.vectorizer.transform(texts)) == 1
+
+        analyzer, term_weights, intercept = self._linear
+        predictions = np.empty(len(texts), dtype=bool)
+        for i, text in enumerate(texts):
+            counts = Counter(token for token in analyzer(text) if token in term_weights)
+            dot = 0.0
+            norm_sq = 0.0
+            for term, count in counts.items():
+                weight, idf = term_weights[term]
+                dot += count * weight
+                norm_sq += (count * idf) ** 2
+            logit = intercept + (dot / math.sqrt(norm_sq) if norm_sq else 0.0)
+            predictions[i] = logit > 0
+        return predictions
 
 if __name__ == "__main__":
     model = STARModel()
@@ -41,7 +41,17 @@
 import os
 import sys
 import joblib
+import numpy as np
 import pandas as pd
+
+# Optional: Intel's oneDAL-backed scikit-learn (AVX-512 lbfgs). Must be
+# patched in before the sklearn estimators below are imported.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import GridSearchCV
@@ -63,17 +73,21 @@ def train_model(data_path: str):
     data = preprocess_data(load_data(data_path))
     X, y = data["text"], data["label"]
 
-    vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2))
+    # float32 halves the sparse matrix's data array; no effect on an L2 LR
+    vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), dtype=np.float32)
     X_vec = vectorizer.fit_transform(X)
 
-    grid = GridSearchCV(LogisticRegression(), {
+    # 4 settings x 5 folds = 20 independent fits; run them on all cores
+    grid = GridSearchCV(LogisticRegression(solver="lbfgs"), {
         "C": [0.01, 0.1, 1, 10],
         "penalty": ["l2"]
-    }, cv=5, scoring="f1")
+    }, cv=5, scoring="f1", n_jobs=-1, pre_dispatch="2*n_jobs")
 
     grid.fit(X_vec, y)
     best_model = grid.best_estimator_
 
+    # Saved uncompressed on purpose: the loaders use mmap_mode='r' so forked
+    # workers share the arrays, and joblib cannot memory-map compressed files
     joblib.dump(best_model, "core/model/star_model.pkl")
     joblib.dump(vectorizer, "core/model/star_vectorizer.pkl")
 
@@ -20,7 +20,10 @@ Program flowchart
 import core.extractor as extractor
 from core.model.star_model import STARModel
 from fastapi import FastAPI, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+import os
+import shutil
 import tempfile
 
 app = FastAPI()
@@ -33,20 +36,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def save_upload(upload: UploadFile) -> str:
+    """
+    Copies the uploaded file to a temporary .pdf in 1 MB chunks
+    (never holding the whole PDF in memory) and returns its path.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
+        try:
+            shutil.copyfileobj(upload.file, temp_file, 1024 * 1024)
+        except BaseException:
+            # The caller never gets the path, so clean up here
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
+        return temp_file.name
+
 @app.post("/extract-skills")
 async def extract_skills(file: UploadFile = File(...)):
+    temp_path = None
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            contents = await file.read()
-            temp_file.write(contents)
-            temp_path = temp_file.name
-
-        skills = extractor.extract_skills_from_pdf(temp_path)
+        # Blocking disk I/O and PDF parsing run in the threadpool,
+        # so the event loop keeps serving other requests meanwhile
+        temp_path = await run_in_threadpool(save_upload, file)
+        skills = await run_in_threadpool(extractor.extract_skills_from_pdf, temp_path)
         return {"skills": skills}
 
     except Exception as e:
         return {"error": str(e)}
 
+    finally:
+        if temp_path:
+            os.unlink(temp_path)
+
 
 def main():
     # Step 1: Extract text from resume
@@ -58,7 +79,8 @@ def main():
 
     # Step 3: Detect STAR-compliant sentences
     sentences = text.split(". ")
-    star_sentences = [sent for sent in sentences if model.predict(sent)]
+    star_flags = model.predict_batch(sentences)
+    star_sentences = [sent for sent, is_star in zip(sentences, star_flags) if is_star]
 
     # Step 4: Print results
     print(f"Total Sentences: {len(sentences)}")